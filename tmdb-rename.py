@@ -11,28 +11,319 @@ Or when running:
     TMDB_ACCESS_TOKEN="eyJ..." python3 rename.py /path
 """
 
+import base64
+import ctypes
+import email.utils
 import errno
+import hashlib
+import http.client
+import io
 import json
 import os
 import re
+import sqlite3
+import string
 import sys
+import threading
 import time
-import urllib.error
 import urllib.parse
 import urllib.request
-from dataclasses import dataclass
+from collections import Counter, OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass, field
 from enum import Enum, auto
 from pathlib import Path
-from typing import Any, cast
+from typing import Any, Callable, Iterator, cast
+
+_json_loads: Callable[[bytes | str], Any]
+try:
+    # Optional: parses TMDb responses straight from bytes, several times faster
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+try:
+    # Optional: matches all literal release tags in one linear scan
+    import ahocorasick  # type: ignore[import-not-found, import-untyped, unused-ignore]
+except ImportError:
+    ahocorasick = None
 
 # ========== CONFIGURATION ==========
 
 MAX_PATH_LENGTH = 250
 MIN_VIDEO_SIZE_MB = 100
 MAIN_MOVIE_SIZE_RATIO = 1.1  # Minimum size ratio to consider a file as main movie (10% larger)
+CACHE_DIR = Path.home() / ".cache" / "tmdb-rename"
+API_CACHE_TTL = 7 * 24 * 3600  # Seconds a cached TMDb response is reused across runs
+API_NEGATIVE_TTL = 24 * 3600  # Seconds a cached "not found" (404) is reused
+IMDB_ID_TTL = 30 * 24 * 3600  # Seconds a resolved TMDb -> IMDb id mapping is reused
+API_RETRIES = 3  # Retries for rate-limited (429) or failed TMDb requests
+API_RETRY_BACKOFF = 0.5  # Base delay in seconds, doubled on every retry
+API_RETRY_AFTER_MAX = 60  # Longest wait in seconds honoured from a Retry-After header
+API_MAX_REDIRECTS = 5  # Redirects followed per TMDb request
+SCAN_WORKERS = 8  # Folders scanned concurrently (TMDb lookups are network-bound)
+API_MEMORY_CACHE_SIZE = 4096  # TMDb responses kept in memory (least recently used are dropped)
 
 # ===================================
 
+MB = 1024 * 1024
+
+# Precompiled patterns used on every scanned file/folder name
+_SERIES_TAG_RES = [re.compile(p, re.I) for p in (
+    r'[Ss]\d{1,2}[Ee]\d{1,3}', r'\b[Ss]\d{1,2}\b', r'\d{1,2}[xX]\d{1,3}',
+    r'[Ss]eason\s?\d{1,2}', r'[Ss]taffel\s?\d{1,2}',
+    r'\b[Ee][Pp]?[\.\-\s]?\d{1,3}\b', r'\b(?:Episode|Folge)[\.\-\s]?\d{1,3}\b',
+)]
+_YEAR_RE = re.compile(r'\b(19\d{2}|20\d{2})\b')
+_GROUP_PREFIX_RE = re.compile(r'^[a-z0-9]{2,8}[-_]\s*', re.I)
+_WS_RE = re.compile(r'\s+')
+_PUNCT_RE = re.compile(r"[^\w\s&'\-äöüÄÖÜß]")
+_EDGE_DASH_RE = re.compile(r'^[\s\-]+|[\s\-]+$')
+_CRYPTIC_RE = re.compile(r'^[a-z0-9]{2,8}[-_][a-z0-9]+[-_][a-z0-9]+$', re.I)
+_WORD3_RE = re.compile(r'[a-zA-Z]{3,}')
+_GOOD_WORD_RE = re.compile(r'[a-zA-ZäöüÄÖÜß]{5,}', re.I)
+# ASCII umlaut spellings; "ue" only after a consonant (keeps "Treue", "Dauer")
+_UMLAUTS = {'ae': 'ä', 'oe': 'ö', 'ue': 'ü', 'Ae': 'Ä', 'Oe': 'Ö', 'Ue': 'Ü'}
+_UMLAUT_RE = re.compile(r'(?<=[bcdfghjklmnpqrstvwxzBCDFGHJKLMNPQRSTVWXZ])ue|ae|oe|Ae|Oe|Ue')
+
+
+def _umlaut_repl(m: re.Match[str]) -> str:
+    return _UMLAUTS[m[0]]
+
+
+_EP_WORD_RE = re.compile(r'[Ee]p(?:isode)?\s*[#:]?\s*(\d{1,3})', re.I)
+_SEASON_WORD_RE = re.compile(r'\b(?:season|staffel)\b', re.I)
+_SEASON_SUFFIX_RE = re.compile(r'\s*\b(?:[Ss]eason|[Ss]taffel)\b(?:\s*\d+)?\b.*', re.I)
+_PAREN_YEAR_RE = re.compile(r'\(\d{4}\)')
+_NON_ALNUM_RE = re.compile(r"[^a-z0-9äöüß]+")
+_SERIES_HINT_RE = re.compile(r'[Ss]\d{1,2}[Ee]\d{1,3}|\d{1,2}[xX]\d{1,3}|season|staffel', re.I)
+_SEASON_HINT_RE = re.compile(r's\d{1,2}|season|staffel', re.I)
+_EPISODE_FOLDER_RE = re.compile(
+    r"(?:\b[Ee][Pp]?[\.\-\s]?\d{1,3}\b)|(?:\b(?:Episode|Folge)[\.\-\s]?\d{1,3}\b)|(?:\b\d{2,4}\b)$"
+)
+_PARENT_SERIES_RE = re.compile(r'season|staffel|\d+x\d+', re.I)
+_AND_RE = re.compile(r'\s+[Aa]nd\s+')
+_IMDB_ID_RE = re.compile(r'^tt\d{7,8}$')
+_TAGGED_RE = re.compile(r'^(?P<title>.+)\s\((?P<year>\d{4})\)\s\[(?P<tag>imdbid-(?P<imdb>tt\d{7,}))\]$')
+_COLLECTION_NUM_RE = re.compile(r'\s+\d+(-\d+)?\s*$')
+_TRAILING_NUM_RE = re.compile(r'(\d+)$')
+_GROUP_KEY_PUNCT_RE = re.compile(r'[^\w\s\-äöüÄÖÜ]')
+_SEASON_DIR_RE = re.compile(r'Season\s\d{2}')
+_SAMPLE_RE = re.compile(r'(^|[\._\-\s])sample([\._\-\s]|$)', re.I)
+# Episode markers in priority order: SxxExx, separated Sxx.Exx, then NxM.
+# Searched one after another, so e.g. a 1920x1080 resolution never wins
+# over a later S01E02.
+_EP_RES = (
+    re.compile(r'[Ss](\d{1,2})[Ee](\d{1,3})'),
+    re.compile(r'[Ss](\d{1,2})[\.\-\s]?[Ee](\d{1,3})'),
+    re.compile(r'(\d{1,2})[xX](\d{1,3})'),
+)
+# Review selections like "1,3 5-9"
+_RANGE_RE = re.compile(r'(\d+)(?:-(\d+))?')
+_RANGE_LIST_RE = re.compile(r'[\s,]*\d+(?:-\d+)?(?:[\s,]+\d+(?:-\d+)?)*[\s,]*')
+_FORCED_RE = re.compile(r'[._]forced[._]')
+# Characters not allowed in file names: reserved punctuation and C0 controls
+_BAD_CHARS_TABLE = str.maketrans('', '', '<>:"/\\|?*' + ''.join(map(chr, range(0x20))))
+
+
+def _is_word_char(c: str) -> bool:
+    return c.isalnum() or c == '_'
+
+
+def _find_year(s: str) -> tuple[int, str | None]:
+    """Finds the first standalone 19xx/20xx token as (position, year).
+
+    Same result as _YEAR_RE.search(), but only jumps between '19'/'20'
+    occurrences instead of starting the regex engine on every name.
+    """
+    n = len(s)
+    start = 0
+    while True:
+        i19 = s.find('19', start)
+        i20 = s.find('20', start)
+        i = i20 if i19 == -1 or (i20 != -1 and i20 < i19) else i19
+        if i == -1 or i + 4 > n:
+            return -1, None
+        if (s[i + 2:i + 4].isdecimal()
+                and (i == 0 or not _is_word_char(s[i - 1]))
+                and (i + 4 == n or not _is_word_char(s[i + 4]))):
+            return i, s[i:i + 4]
+        start = i + 1
+
+
+def _match_tagged(name: str) -> re.Match[str] | None:
+    """Matches an already renamed 'Title (Year) [imdbid-tt...]' folder name."""
+    # Untagged names, nearly all of them, fail these checks without the regex
+    if not name.endswith(']') or '[imdbid-tt' not in name:
+        return None
+    return _TAGGED_RE.match(name)
+
+
+# Source of a release pattern that is just a \bWORD\b literal. Hyphenated tags
+# stay regexes so they still win over the trailing '-GROUP' pattern.
+_LITERAL_TAG_RE = re.compile(r'\\b([A-Za-z0-9]+)\\b')
+
+
+def _build_tag_automaton(patterns: list[re.Pattern[str]]) -> tuple[Any, re.Pattern[str] | None]:
+    """Splits patterns into an Aho-Corasick automaton for the plain \\bWORD\\b
+    literals and a regex union for the rest. (None, None) without pyahocorasick.
+    """
+    if ahocorasick is None:
+        return None, None
+    automaton = ahocorasick.Automaton()
+    rest = []
+    for order, pat in enumerate(patterns):
+        m = _LITERAL_TAG_RE.fullmatch(pat.pattern)
+        if not m:
+            rest.append(pat.pattern)
+            continue
+        word = m[1].lower()
+        if word not in automaton:
+            automaton.add_word(word, (order, len(word)))
+    automaton.make_automaton()
+    rest_union = re.compile('|'.join(f'(?:{p})' for p in rest), re.I) if rest else None
+    return automaton, rest_union
+
+
+def _strip_literal_tags(automaton: Any, s: str) -> str | None:
+    """Replaces every whole-word literal from the automaton with a space.
+
+    Overlaps resolve like a regex alternation: leftmost match first, then the
+    earlier pattern. None if lowercasing changes the length (offsets unusable).
+    """
+    low = s.lower()
+    if len(low) != len(s):
+        return None
+    n = len(s)
+    spans = []
+    for last, (order, length) in automaton.iter(low):
+        start = last - length + 1
+        if ((start == 0 or not _is_word_char(s[start - 1]))
+                and (last + 1 == n or not _is_word_char(s[last + 1]))):
+            spans.append((start, order, last + 1))
+    if not spans:
+        return s
+    spans.sort()
+    parts = []
+    pos = 0
+    for start, _, stop in spans:
+        if start < pos:
+            continue
+        parts.append(s[pos:start])
+        parts.append(' ')
+        pos = stop
+    parts.append(s[pos:])
+    return ''.join(parts)
+
+
+def _valid_imdb(s: str) -> bool:
+    """tt followed by at least 7 digits, as used in [imdbid-...] tags."""
+    # isdecimal() is what \d matches; isdigit() would also accept e.g. '²'
+    return len(s) >= 9 and s.startswith('tt') and s[2:].isdecimal()
+
+
+def _search_episode(name: str) -> tuple[int, int] | None:
+    """Finds the highest-priority SxxExx/NxM marker in a name as (season, episode)."""
+    # SxxExx needs an s, NxM an x; most movie names can skip the regexes
+    has_s = 's' in name or 'S' in name
+    has_x = 'x' in name or 'X' in name
+    if not has_s and not has_x:
+        return None
+    sxe, sxe_sep, nxm = _EP_RES
+    m = None
+    if has_s:
+        m = sxe.search(name) or sxe_sep.search(name)
+    if m is None and has_x:
+        m = nxm.search(name)
+    return (int(m[1]), int(m[2])) if m else None
+
+
+# Linux statx(2): fetch only the fields we need and skip the sync that
+# network filesystems (NFS/SMB) otherwise perform on every stat.
+_AT_FDCWD = -100
+_AT_STATX_DONT_SYNC = 0x4000
+_STATX_TYPE = 0x0001
+_STATX_SIZE = 0x0200
+
+
+class _StatxTimestamp(ctypes.Structure):
+    _fields_ = [('tv_sec', ctypes.c_int64), ('tv_nsec', ctypes.c_uint32), ('_reserved', ctypes.c_int32)]
+
+
+class _StatxBuf(ctypes.Structure):
+    _fields_ = [
+        ('stx_mask', ctypes.c_uint32), ('stx_blksize', ctypes.c_uint32),
+        ('stx_attributes', ctypes.c_uint64),
+        ('stx_nlink', ctypes.c_uint32), ('stx_uid', ctypes.c_uint32), ('stx_gid', ctypes.c_uint32),
+        ('stx_mode', ctypes.c_uint16), ('_spare0', ctypes.c_uint16),
+        ('stx_ino', ctypes.c_uint64), ('stx_size', ctypes.c_uint64), ('stx_blocks', ctypes.c_uint64),
+        ('stx_attributes_mask', ctypes.c_uint64),
+        ('stx_atime', _StatxTimestamp), ('stx_btime', _StatxTimestamp),
+        ('stx_ctime', _StatxTimestamp), ('stx_mtime', _StatxTimestamp),
+        ('stx_rdev_major', ctypes.c_uint32), ('stx_rdev_minor', ctypes.c_uint32),
+        ('stx_dev_major', ctypes.c_uint32), ('stx_dev_minor', ctypes.c_uint32),
+        ('_spare2', ctypes.c_uint64 * 14),
+    ]
+
+
+_HAS_STATX: bool | None = None  # None = not probed yet
+_libc_statx: Any = None
+
+
+def _statx(path: str | os.PathLike[str], mask: int) -> _StatxBuf | None:
+    """Calls statx(2) on Linux; returns None when it is not available."""
+    global _HAS_STATX, _libc_statx
+    if _HAS_STATX is None:
+        _HAS_STATX = False
+        if sys.platform.startswith('linux'):
+            try:
+                _libc_statx = ctypes.CDLL(None, use_errno=True).statx
+                _HAS_STATX = True
+            except (OSError, AttributeError):
+                pass
+    if not _HAS_STATX:
+        return None
+
+    buf = _StatxBuf()
+    if _libc_statx(_AT_FDCWD, os.fsencode(path), _AT_STATX_DONT_SYNC, mask, ctypes.byref(buf)) != 0:
+        err = ctypes.get_errno()
+        if err in (errno.ENOSYS, errno.EPERM):
+            # Old kernel or seccomp filter: fall back to os.stat for good
+            _HAS_STATX = False
+            return None
+        raise OSError(err, os.strerror(err), os.fspath(path))
+    return buf
+
+
+def _file_size(path: str | os.PathLike[str]) -> int:
+    buf = _statx(path, _STATX_TYPE | _STATX_SIZE)
+    if buf is None:
+        return os.stat(path).st_size
+    size: int = buf.stx_size
+    return size
+
+
+def _device_id(path: str | os.PathLike[str]) -> int:
+    # stx_dev_* is always filled in, whatever the requested mask
+    buf = _statx(path, _STATX_TYPE)
+    if buf is None:
+        return os.stat(path).st_dev
+    return os.makedev(buf.stx_dev_major, buf.stx_dev_minor)
+
+
+def _retry_after_seconds(value: str | None, default: float) -> float:
+    """Delay asked for by a Retry-After header (seconds or HTTP-date), capped."""
+    delay = default
+    if value:
+        value = value.strip()
+        if value.isdigit():
+            delay = float(value)
+        elif parsed := email.utils.parsedate_tz(value):
+            delay = max(0.0, email.utils.mktime_tz(parsed) - time.time())
+    return min(delay, API_RETRY_AFTER_MAX)
+
 
 def get_tmdb_token() -> str | None:
     """Reads the TMDb access token from environment variables."""
@@ -57,6 +348,9 @@ def get_tmdb_token() -> str | None:
     return None
 
 
+_HEX_DIGITS = frozenset(string.hexdigits)
+
+
 def check_token(token: str | None) -> bool:
     """Checks whether a valid token is available."""
     if not token:
@@ -66,11 +360,25 @@ def check_token(token: str | None) -> bool:
     if token.startswith("eyJ") and token.count(".") == 2:
         return True
     
-    # Also accept API Key v3 format (32 hex digits)
-    if re.match(r'^[a-f0-9]{32}$', token, re.I):
-        return True
-    
-    return False
+    # Also accept API Key v3 format (32 hex digits). A set check rather than
+    # int(token, 16), which would also accept "0x", "_", signs and whitespace.
+    return len(token) == 32 and _HEX_DIGITS.issuperset(token)
+
+
+@contextmanager
+def _buffered_stdout() -> Iterator[None]:
+    """Block-buffers stdout for a bulk listing; flushed and restored on exit."""
+    stream = sys.stdout
+    if not isinstance(stream, io.TextIOWrapper):
+        yield
+        return
+    line_buffering = stream.line_buffering
+    stream.reconfigure(line_buffering=False)
+    try:
+        yield
+    finally:
+        stream.reconfigure(line_buffering=line_buffering)
+        stream.flush()
 
 
 class MediaType(Enum):
@@ -90,13 +398,13 @@ class MatchStatus(Enum):
     RENAMED = "★"
 
 
-@dataclass
+@dataclass(slots=True)
 class EpisodeInfo:
     season: int
     episode: int
 
 
-@dataclass
+@dataclass(slots=True)
 class VideoFile:
     path: Path
     size_bytes: int
@@ -117,7 +425,7 @@ class VideoFile:
         return self.path.stem
 
 
-@dataclass
+@dataclass(slots=True)
 class MediaMatch:
     tmdb_id: int
     imdb_id: str | None
@@ -128,7 +436,7 @@ class MediaMatch:
     popularity: float = 0.0
 
 
-@dataclass
+@dataclass(slots=True)
 class CollectionItem:
     folder_path: Path | None
     video_path: Path
@@ -140,7 +448,7 @@ class CollectionItem:
     status: MatchStatus = MatchStatus.NONE
 
 
-@dataclass
+@dataclass(slots=True)
 class ScanResult:
     path: Path
     folder_name: str
@@ -156,6 +464,7 @@ class ScanResult:
     collection_items: list[CollectionItem] | None = None
     season_number: int | None = None  # Added for series season detection
     series_name: str | None = None  # Added for series grouping
+    log: list[str] = field(default_factory=list)  # Printed by scan_all, not from the workers
 
     @property
     def is_collection(self) -> bool:
@@ -166,7 +475,7 @@ class ScanResult:
         return len(self.videos)
 
 
-@dataclass
+@dataclass(slots=True)
 class RenameOp:
     old: str
     new: str
@@ -177,8 +486,176 @@ class RenameError(Exception):
     pass
 
 
+class ResultsView:
+    """Positions of the scan results grouped by status.
+
+    Kept up to date by MediaRenamer._set_status() instead of being rebuilt,
+    so the review buckets cost O(k) for k matching results.
+    """
+
+    __slots__ = ('results', 'by_status', '_pos')
+
+    def __init__(self, results: list[ScanResult]) -> None:
+        self.results = results
+        self.by_status: dict[MatchStatus, set[int]] = {status: set() for status in MatchStatus}
+        # A result can sit in the list twice (handle_collection may return it)
+        self._pos: dict[int, list[int]] = {}
+        for i, r in enumerate(results):
+            self._index(i, r)
+
+    def _index(self, i: int, r: ScanResult) -> None:
+        self._pos.setdefault(id(r), []).append(i)
+        self.by_status[r.status].add(i)
+
+    def extend(self, new_results: list[ScanResult]) -> None:
+        """Appends to the underlying results list and indexes the new entries."""
+        for r in new_results:
+            self.results.append(r)
+            self._index(len(self.results) - 1, r)
+
+    def move(self, r: ScanResult, status: MatchStatus) -> None:
+        """Re-files r under status; results not in the list are ignored."""
+        for i in self._pos.get(id(r), ()):
+            self.by_status[r.status].discard(i)
+            self.by_status[status].add(i)
+
+    def indices(self, *statuses: MatchStatus) -> list[int]:
+        """Sorted positions of all results with one of the given statuses."""
+        return sorted(set().union(*(self.by_status[s] for s in statuses)))
+
+    def excluding(self, status: MatchStatus) -> list[int]:
+        """Positions of all results whose status is not the given one."""
+        exclude = self.by_status[status]
+        return [i for i in range(len(self.results)) if i not in exclude]
+
+
+# In-memory cache key of a TMDb request: (endpoint, sorted query items)
+_RequestKey = tuple[str, tuple[tuple[str, Any], ...]]
+# Connection to a TMDb host: (connection, request-target prefix, extra headers)
+_Connection = tuple[http.client.HTTPConnection, str, dict[str, str]]
+
+
+class TMDbCache:
+    """Persistent TMDb response cache kept in a small SQLite database.
+
+    Raw response bodies are stored by a hash of endpoint + sorted query
+    parameters. "Not found" answers are stored as NULL with a shorter TTL.
+    Resolved IMDb ids are kept in their own table, since they rarely change.
+    If the database cannot be opened, the cache silently stays disabled.
+    """
+
+    def __init__(self, path: Path, ttl: int = API_CACHE_TTL, negative_ttl: int = API_NEGATIVE_TTL) -> None:
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self._batch_depth = 0
+        self._lock = threading.Lock()
+        self._db: sqlite3.Connection | None = None
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            # Shared by the scan worker threads, serialized through _lock
+            self._db = sqlite3.connect(path, check_same_thread=False)
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS responses (key TEXT PRIMARY KEY, value BLOB, ts INTEGER NOT NULL)"
+            )
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS imdb_ids (tmdb_id INTEGER NOT NULL, media_type TEXT NOT NULL,"
+                " imdb_id TEXT NOT NULL, ts INTEGER NOT NULL, PRIMARY KEY (tmdb_id, media_type))"
+            )
+            now = int(time.time())
+            self._db.execute("DELETE FROM responses WHERE ts < ?", (now - max(ttl, negative_ttl),))
+            self._db.execute("DELETE FROM imdb_ids WHERE ts < ?", (now - IMDB_ID_TTL,))
+            self._db.commit()
+        except (OSError, sqlite3.Error) as e:
+            print(f"  ⚠ TMDb cache disabled: {e}")
+            self._db = None
+
+    @staticmethod
+    def make_key(endpoint: str, params: dict[str, Any] | None = None) -> str:
+        raw = endpoint
+        if params:
+            raw += "?" + urllib.parse.urlencode(sorted(params.items()))
+        return hashlib.blake2b(raw.encode(), digest_size=16).hexdigest()
+
+    def get(self, key: str) -> tuple[bool, bytes | None]:
+        """Returns (hit, body); body is None for a cached "not found"."""
+        if self._db is None:
+            return False, None
+        try:
+            with self._lock:
+                row = self._db.execute("SELECT value, ts FROM responses WHERE key = ?", (key,)).fetchone()
+        except sqlite3.Error:
+            return False, None
+        if row is None:
+            return False, None
+        value, ts = row
+        age = time.time() - ts
+        if age >= (self.ttl if value is not None else self.negative_ttl):
+            return False, None
+        return True, value
+
+    def put(self, key: str, body: bytes | None) -> None:
+        if self._db is None:
+            return
+        try:
+            with self._lock:
+                self._db.execute(
+                    "INSERT OR REPLACE INTO responses (key, value, ts) VALUES (?, ?, ?)",
+                    (key, body, int(time.time())),
+                )
+                if not self._batch_depth:
+                    self._db.commit()
+        except sqlite3.Error:
+            pass
+
+    def get_imdb_id(self, tmdb_id: int, media_type: str) -> str | None:
+        if self._db is None:
+            return None
+        try:
+            with self._lock:
+                row = self._db.execute(
+                    "SELECT imdb_id, ts FROM imdb_ids WHERE tmdb_id = ? AND media_type = ?",
+                    (tmdb_id, media_type),
+                ).fetchone()
+        except sqlite3.Error:
+            return None
+        if row is None or time.time() - row[1] >= IMDB_ID_TTL:
+            return None
+        imdb_id: str | None = row[0]
+        return imdb_id
+
+    def put_imdb_id(self, tmdb_id: int, media_type: str, imdb_id: str) -> None:
+        if self._db is None:
+            return
+        try:
+            with self._lock:
+                self._db.execute(
+                    "INSERT OR REPLACE INTO imdb_ids (tmdb_id, media_type, imdb_id, ts) VALUES (?, ?, ?, ?)",
+                    (tmdb_id, media_type, imdb_id, int(time.time())),
+                )
+                if not self._batch_depth:
+                    self._db.commit()
+        except sqlite3.Error:
+            pass
+
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        """Groups all writes inside the block into a single transaction."""
+        self._batch_depth += 1
+        try:
+            yield
+        finally:
+            self._batch_depth -= 1
+            if not self._batch_depth and self._db is not None:
+                try:
+                    with self._lock:
+                        self._db.commit()
+                except sqlite3.Error:
+                    pass
+
+
 class MediaRenamer:
-    RELEASE_PATTERNS = [
+    RELEASE_PATTERNS = [re.compile(p, re.I) for p in (
         r'\bTrueHD\b',
         r'\bDTS-HD[\s\.]?MA\b',
         r'\bDTS-HD\b',
@@ -270,22 +747,28 @@ class MediaRenamer:
         r'\bDer\s+Legend\b',
         r'\bDas\s+Abenteuer\b',
         r'\bder\s+Adlerkrieger\b',
-    ]
+    )]
 
-    END_ONLY_PATTERNS = [
+    END_ONLY_PATTERNS = [re.compile(p + r'\s*$', re.I) for p in (
         r'\bDC\b',
         r'\bHD\b',
         r'\bSD\b',
-    ]
+    )]
+
+    # Single-pass alternation of RELEASE_PATTERNS
+    _RELEASE_UNION = re.compile('|'.join(f'(?:{p.pattern})' for p in RELEASE_PATTERNS), re.I)
+    # With pyahocorasick: literal tags via automaton, the remaining regexes via union
+    _RELEASE_AC, _RELEASE_REST_UNION = _build_tag_automaton(RELEASE_PATTERNS)
 
-    COLLECTION_PATTERNS = [
+    COLLECTION_PATTERNS = [re.compile(p, re.I) for p in (
         r'[Cc]ollection',
         r'[Ss]ammlung',
         r'[Aa]nthology',
         r'[Ss]aga',
         r'[Bb]ox\.?[Ss]et',
         r'\d{4}\s*[-–]\s*\d{4}',
-    ]
+    )]
+    _COLL_UNION = re.compile('|'.join(f'(?:{p.pattern})' for p in COLLECTION_PATTERNS), re.I)
 
     IGNORE_DIRS = frozenset({
         'sample', 'samples', 'proof', 'extra', 'extras', 'behind the scenes',
@@ -296,9 +779,12 @@ class MediaRenamer:
     # Audio file extensions commonly used for audiobooks
     AUDIOBOOK_EXTS: frozenset[str] = frozenset({'.mp3', '.m4b', '.aac', '.flac', '.wav', '.ogg'})
     # Keywords commonly found in audiobook folder/filenames
-    AUDIOBOOK_KEYWORDS: list[str] = ['h[oö]rbuch', 'audiobook', 'hörspiel', 'hörbuch', 'audio book', 'hör-buch']
+    AUDIOBOOK_KEYWORDS: list[re.Pattern[str]] = [
+        re.compile(p, re.I) for p in ('h[oö]rbuch', 'audiobook', 'hörspiel', 'hörbuch', 'audio book', 'hör-buch')
+    ]
 
     VIDEO_EXT = frozenset({'.mkv', '.mp4', '.avi', '.m4v', '.wmv', '.mov', '.ts', '.m2ts'})
+    _VIDEO_EXT_NODOT = frozenset(e[1:] for e in VIDEO_EXT)
     SUB_EXT = frozenset({'.srt', '.sub', '.ass', '.ssa', '.vtt', '.idx', '.sup'})
     RENAME_EXT = frozenset({'.mkv', '.mp4', '.avi', '.m4v', '.nfo'})
     SCENE_TRASH_EXT = frozenset({'.sfv', '.par2', '.md5', '.sha1', '.sha256', '.crc', '.diz'})
@@ -308,28 +794,31 @@ class MediaRenamer:
         'eng': 'en', 'english': 'en', 'fre': 'fr', 'french': 'fr',
         'spa': 'es', 'spanish': 'es', 'ita': 'it', 'italian': 'it',
     }
+    _LANG_RES = [(re.compile(rf'[._]{code}[._]'), f'.{norm}') for code, norm in LANG_MAP.items()]
 
-    UMLAUTS = {'ae': 'ä', 'oe': 'ö', 'ue': 'ü', 'Ae': 'Ä', 'Oe': 'Ö', 'Ue': 'Ü'}
+    UMLAUTS = _UMLAUTS
 
-    EP_PATTERNS = [
-        r'[Ss](\d{1,2})[Ee](\d{1,3})',
-        r'[Ss](\d{1,2})[\.\-\s]?[Ee](\d{1,3})',
-        r'(\d{1,2})[xX](\d{1,3})',
-    ]
+    # Order of the per-status totals in show_scan_results
+    STATUS_ORDER = (MatchStatus.AUTO, MatchStatus.UNSURE, MatchStatus.MANUAL,
+                    MatchStatus.NONE, MatchStatus.SKIP, MatchStatus.DONE, MatchStatus.RENAMED)
 
-    EP_ONLY_PATTERNS = [
+    # The module-level regexes _search_episode() uses; the character classes
+    # already spell out both cases, so re.I would add nothing
+    EP_PATTERNS = list(_EP_RES)
+
+    EP_ONLY_PATTERNS = [re.compile(p, re.I) for p in (
         r'\b[Ee][Pp]?[\.\-\s]?(\d{1,3})\b',
         r'\b(?:Episode|Folge)[\.\-\s]?(\d{1,3})\b',
-    ]
+    )]
     
     # Enhanced season patterns for better series detection
-    SEASON_PATTERNS = [
+    SEASON_PATTERNS = [re.compile(p, re.I) for p in (
         r'[Ss]eason\s*(\d{1,2})',
         r'[Ss]taffel\s*(\d{1,2})',
         r'(?:Staffel|Season)\s*(\d{1,2})',
         r'S\s?(\d{1,2})\s*$',
         r'^\s*(\d{1,2})\s*x\s*\d{1,3}',  # Pattern like "1x01" at start of name
-    ]
+    )]
 
     TMDB_BASE = "https://api.themoviedb.org/3"
 
@@ -339,13 +828,25 @@ class MediaRenamer:
         interactive: bool = True,
         debug_series: bool = False,
         series_batch_mode: bool = True,
-    ):
+    ) -> None:
         self.access_token = access_token
         self.interactive = interactive
         self.debug_series = debug_series
         self.series_batch_mode = series_batch_mode
         self._ops: list[RenameOp] = []
-        self._cache: dict[str, Any] = {}
+        self._dev_cache: dict[str, int] = {}
+        self._cache: OrderedDict[_RequestKey, dict[str, Any] | None] = OrderedDict()
+        self._cache_lock = threading.Lock()
+        self._api_cache = TMDbCache(CACHE_DIR / "api.sqlite")
+        self._api_url = urllib.parse.urlsplit(self.TMDB_BASE)
+        self._local = threading.local()
+        # Per-run memos: sibling folders/files repeat the same names and titles
+        self._title_cache: dict[str, tuple[str | None, str | None]] = {}
+        self._search_cache: dict[tuple[str, str | None, MediaType], list[MediaMatch]] = {}
+        self._imdb_id_memo: dict[tuple[int, str], str] = {}
+        # Status index of the results under interactive review, if any
+        self._view: ResultsView | None = None
+        self._last_render_key: tuple[tuple[Any, ...], ...] | None = None
         
         # Manual mappings storage (folder_name -> imdb_id)
         self._manual_mappings: dict[str, str] = {}
@@ -373,38 +874,58 @@ class MediaRenamer:
 
     def verify_api_connection(self) -> bool:
         """Tests the API connection."""
-        data = self._tmdb_request("/configuration")
+        data = self._tmdb_request("/configuration", persistent=False)
         return data is not None and "images" in data
 
+    def _set_status(self, result: ScanResult, status: MatchStatus) -> None:
+        """Sets result.status, keeping the review index in step."""
+        if self._view is not None:
+            self._view.move(result, status)
+        result.status = status
+
     # ==================== FILESYSTEM ====================
 
-    def _same_fs(self, a: Path, b: Path) -> bool:
+    def _get_dev(self, p: str | Path) -> int:
+        """Device id of the directory containing p, cached per directory.
+
+        Keyed by parent so sources and targets in one folder share a single
+        stat, and no exists() probe is needed. A source that is itself a mount
+        point is not caught here; the rename then fails with EXDEV/EBUSY.
+        """
+        parent = os.path.dirname(os.fspath(p)) or os.curdir
+        try:
+            return self._dev_cache[parent]
+        except KeyError:
+            dev = self._dev_cache[parent] = _device_id(parent)
+            return dev
+
+    def _same_fs(self, a: str | Path, b: str | Path) -> bool:
         try:
-            dev_a = (a if a.exists() else a.parent).stat().st_dev
-            dev_b = (b if b.exists() else b.parent).stat().st_dev
-            return dev_a == dev_b
+            return self._get_dev(a) == self._get_dev(b)
         except OSError:
             return False
 
-    def _rename(self, src: Path, dst: Path) -> None:
-        if not src.exists():
-            raise RenameError(f"Source missing: {src.name}")
-        if dst.exists() and src.resolve() != dst.resolve():
-            raise RenameError(f"Destination exists: {dst.name}")
+    def _rename(self, src: str, dst: str) -> None:
+        # Plain os.path calls on strings; this runs once per renamed file
+        if not os.path.exists(src):
+            raise RenameError(f"Source missing: {os.path.basename(src)}")
+        if os.path.exists(dst) and os.path.realpath(src) != os.path.realpath(dst):
+            raise RenameError(f"Destination exists: {os.path.basename(dst)}")
         if not self._same_fs(src, dst):
             raise RenameError("Cross-filesystem moves are not allowed")
         try:
-            os.rename(src, dst)
+            # dst is known to be free (or the same file), so replace == rename
+            os.replace(src, dst)
         except OSError as e:
             errno_value = e.errno if e.errno is not None else 0
             msg = {errno.EXDEV: "Cross-device", errno.EACCES: "Access denied",
                    errno.EPERM: "Permission denied"}.get(errno_value, f"OS error {e.errno}")
-            raise RenameError(f"{msg}: {src.name}")
+            raise RenameError(f"{msg}: {os.path.basename(src)}")
 
-    def _do_rename(self, old: Path, new: Path) -> None:
-        op = RenameOp(old=str(old), new=str(new))
+    def _do_rename(self, old: str | Path, new: str | Path) -> None:
+        op = RenameOp(old=os.fspath(old), new=os.fspath(new))
         self._ops.append(op)
-        self._rename(old, new)
+        self._rename(op.old, op.new)
         op.done = True
 
     def _rollback(self) -> None:
@@ -414,13 +935,16 @@ class MediaRenamer:
             return
         print("\n  🔄 Rollback...")
         for op in reversed(done):
-            src, dst = Path(op.new), Path(op.old)
-            if src.exists():
+            src, dst = op.new, op.old
+            if os.path.exists(src):
+                name = os.path.basename(src)
                 try:
+                    # os.rename, not replace: never clobber a file that has
+                    # appeared at the original path in the meantime (Windows)
                     os.rename(src, dst)
-                    print(f"     ↩ {src.name}")
+                    print(f"     ↩ {name}")
                 except OSError as e:
-                    print(f"     ❌ {src.name}: {e}")
+                    print(f"     ❌ {name}: {e}")
         self._ops.clear()
 
     def _commit(self) -> None:
@@ -429,50 +953,56 @@ class MediaRenamer:
     # ==================== TITLE EXTRACTION ====================
 
     def _extract_title_year(self, name: str) -> tuple[str | None, str | None]:
+        try:
+            return self._title_cache[name]
+        except KeyError:
+            pass
+        result = self._parse_title_year(name)
+        self._title_cache[name] = result
+        return result
+
+    def _parse_title_year(self, name: str) -> tuple[str | None, str | None]:
         # Skip audiobook folders entirely
         for keyword in self.AUDIOBOOK_KEYWORDS:
-            if re.search(keyword, name, re.IGNORECASE):
+            if keyword.search(name):
                 return None, None
 
         clean = name
 
-        for ext in self.VIDEO_EXT:
-            if clean.lower().endswith(ext):
-                clean = clean[:-len(ext)]
-                break
+        head, dot, ext = clean.rpartition('.')
+        if dot and ext.lower() in self._VIDEO_EXT_NODOT:
+            clean = head
 
         clean = clean.replace('.', ' ').replace('_', ' ')
 
-        for pat in [r'[Ss]\d{1,2}[Ee]\d{1,3}', r'\b[Ss]\d{1,2}\b', r'\d{1,2}[xX]\d{1,3}',
-                r'[Ss]eason\s?\d{1,2}', r'[Ss]taffel\s?\d{1,2}',
-                r'\b[Ee][Pp]?[\.\-\s]?\d{1,3}\b', r'\b(?:Episode|Folge)[\.\-\s]?\d{1,3}\b']:
-            clean = re.sub(pat, ' ', clean, flags=re.I)
-
-        for pat in self.COLLECTION_PATTERNS:
-            clean = re.sub(pat, ' ', clean, flags=re.I)
-
-        year_m = re.search(r'\b(19\d{2}|20\d{2})\b', clean)
-        year = year_m[1] if year_m else None
+        for pat in _SERIES_TAG_RES:
+            clean = pat.sub(' ', clean)
 
-        if year:
-            year_pos = clean.find(year)
-            if year_pos > 10:
-                clean = clean[:year_pos + 4]
+        clean = self._COLL_UNION.sub(' ', clean)
 
-        for pat in self.RELEASE_PATTERNS:
-            clean = re.sub(pat, ' ', clean, flags=re.I)
+        year_pos, year = _find_year(clean)
+        if year and year_pos > 10:
+            clean = clean[:year_pos + 4]
 
+        stripped = None
+        if self._RELEASE_AC is not None:
+            rest = self._RELEASE_REST_UNION.sub(' ', clean) if self._RELEASE_REST_UNION else clean
+            stripped = _strip_literal_tags(self._RELEASE_AC, rest)
+        clean = stripped if stripped is not None else self._RELEASE_UNION.sub(' ', clean)
+        # Applied one after another: each may expose the next trailing tag
         for pat in self.END_ONLY_PATTERNS:
-            clean = re.sub(pat + r'\s*$', ' ', clean, flags=re.I)
+            clean = pat.sub(' ', clean)
 
-        clean = re.sub(r'^[a-z0-9]{2,8}[-_]\s*', '', clean, flags=re.I)
+        clean = _GROUP_PREFIX_RE.sub('', clean)
 
-        title = re.sub(r'\b(19\d{2}|20\d{2})\b', '', clean)
+        # Tag removal cannot create a new year token, so without a year
+        # there is nothing to strip
+        title = _YEAR_RE.sub('', clean) if year else clean
 
-        title = re.sub(r'\s+', ' ', title).strip()
-        title = re.sub(r"[^\w\s&'\-äöüÄÖÜß]", '', title).strip()
-        title = re.sub(r'\s+', ' ', title).strip()
-        title = re.sub(r'^[\s\-]+|[\s\-]+$', '', title)
+        title = _WS_RE.sub(' ', title).strip()
+        title = _PUNCT_RE.sub('', title).strip()
+        title = _WS_RE.sub(' ', title).strip()
+        title = _EDGE_DASH_RE.sub('', title)
 
         if not title or len(title) < 2:
             return None, year
@@ -485,10 +1015,10 @@ class MediaRenamer:
     def _is_cryptic_filename(self, filename: str) -> bool:
         stem = Path(filename).stem
 
-        if re.match(r'^[a-z0-9]{2,8}[-_][a-z0-9]+[-_][a-z0-9]+$', stem, re.I):
+        if _CRYPTIC_RE.match(stem):
             return True
 
-        words = re.findall(r'[a-zA-Z]{3,}', stem)
+        words = _WORD3_RE.findall(stem)
         if len(words) < 2:
             return True
 
@@ -496,13 +1026,7 @@ class MediaRenamer:
 
     def _to_umlauts(self, text: str) -> str:
         """Convert ASCII representations of German umlauts to actual umlauts."""
-        result = text
-        for ascii_v, umlaut in self.UMLAUTS.items():
-            if ascii_v == 'ue':
-                result = re.sub(r'(?<=[bcdfghjklmnpqrstvwxzBCDFGHJKLMNPQRSTVWXZ])ue', umlaut, result)
-            else:
-                result = result.replace(ascii_v, umlaut)
-        return result
+        return _UMLAUT_RE.sub(_umlaut_repl, text)
 
     def _from_umlauts(self, text: str) -> str:
         """Convert German umlauts to ASCII representations for search."""
@@ -536,62 +1060,82 @@ class MediaRenamer:
             if path.parent.parent:
                 names_to_check.append(path.parent.parent.name.lower())
         
-        for name in names_to_check:
-            for keyword in self.AUDIOBOOK_KEYWORDS:
-                # Prüfe auf genaue Übereinstimmung oder Übereinstimmung als separates Wort
-                if re.search(r'\b' + keyword + r'\b', name, re.IGNORECASE):
-                    return True
-                
-                # Zusätzliche Prüfung für Teile des Namens
-                if re.search(keyword, name, re.IGNORECASE):
-                    return True
-        
-        return False
+        return any(self._has_audiobook_keyword(name) for name in names_to_check)
+
+    def _has_audiobook_keyword(self, name: str) -> bool:
+        """Check a single file or folder name for audiobook keywords."""
+        # Match anywhere in the name (also covers whole-word matches)
+        return any(keyword.search(name) for keyword in self.AUDIOBOOK_KEYWORDS)
 
     # ==================== DETECTION ====================
 
     def _find_videos(self, directory: Path, max_depth: int = 5) -> list[VideoFile]:
         videos: list[VideoFile] = []
+        min_size = MIN_VIDEO_SIZE_MB * MB
 
-        def scan(d: Path, depth: int = 0, parent_is_root: bool = True):
-            if depth > max_depth or d.name.lower() in self.IGNORE_DIRS:
-                return
-            # Skip audiobook directories entirely
-            if self._is_audiobook(d):
-                return
+        if directory.name.lower() in self.IGNORE_DIRS:
+            return videos
+        # Skip audiobook directories entirely
+        if self._is_audiobook(directory):
+            return videos
+
+        def listing(d: str | Path) -> list[os.DirEntry[str]]:
+            entries: list[os.DirEntry[str]] = []
             try:
-                for item in d.iterdir():
-                    # Skip audiobook files
-                    if self._is_audiobook(item):
+                with os.scandir(d) as it:
+                    for entry in it:
+                        entries.append(entry)
+            except PermissionError:
+                pass
+            return entries
+
+        # Explicit stack instead of recursion: (remaining entries, depth,
+        # parent_is_root). A subdirectory is entered as soon as it's listed
+        # and its parent resumes afterwards, so the order stays depth-first.
+        stack: list[tuple[Iterator[os.DirEntry[str]], int, bool]] = [(iter(listing(directory)), 0, True)]
+        while stack:
+            entries, depth, parent_is_root = stack[-1]
+            # Parent and grandparent names were already checked on the way
+            # down, so only the entry's own name needs the audiobook test.
+            for entry in entries:
+                name = entry.name
+                if self._has_audiobook_keyword(name):
+                    continue
+                if entry.is_file():
+                    head, _dot, ext = name.rpartition('.')
+                    if not head or ext.lower() not in self._VIDEO_EXT_NODOT:
+                        continue
+                    try:
+                        size = _file_size(entry.path)
+                    except OSError:
+                        continue
+                    if size < min_size:
                         continue
-                    if item.is_file() and item.suffix.lower() in self.VIDEO_EXT:
-                        try:
-                            size = item.stat().st_size
-                            if size >= MIN_VIDEO_SIZE_MB * 1024 * 1024:
-                                vf = VideoFile(path=item, size_bytes=size)
-                                vf.episode_info = self._parse_episode(item.name)
-                                vf.media_type = MediaType.SERIES if vf.episode_info else MediaType.MOVIE
 
-                                if not parent_is_root and item.parent != directory:
-                                    vf.parent_folder = item.parent
+                    item = Path(entry.path)
+                    vf = VideoFile(path=item, size_bytes=size)
+                    vf.episode_info = self._parse_episode(name)
+                    vf.media_type = MediaType.SERIES if vf.episode_info else MediaType.MOVIE
 
-                                best_name = vf.parent_folder.name if vf.parent_folder else item.stem
+                    if not parent_is_root:
+                        vf.parent_folder = item.parent
 
-                                if self._is_cryptic_filename(item.name) and vf.parent_folder:
-                                    best_name = vf.parent_folder.name
+                    best_name = vf.parent_folder.name if vf.parent_folder else item.stem
 
-                                title, year = self._extract_title_year(best_name)
-                                vf.extracted_title = title
-                                vf.extracted_year = year
-                                videos.append(vf)
-                        except OSError:
-                            pass
-                    elif item.is_dir():
-                        scan(item, depth + 1, parent_is_root=False)
-            except PermissionError:
-                pass
+                    if self._is_cryptic_filename(name) and vf.parent_folder:
+                        best_name = vf.parent_folder.name
+
+                    title, year = self._extract_title_year(best_name)
+                    vf.extracted_title = title
+                    vf.extracted_year = year
+                    videos.append(vf)
+                elif entry.is_dir():
+                    if depth < max_depth and name.lower() not in self.IGNORE_DIRS:
+                        stack.append((iter(listing(entry.path)), depth + 1, False))
+                        break
+            else:
+                stack.pop()
 
-        scan(directory)
         return sorted(videos, key=lambda v: v.size_bytes, reverse=True)
 
     def _parse_episode(self, name: str) -> EpisodeInfo | None:
@@ -609,18 +1153,14 @@ class MediaRenamer:
             EpisodeInfo | None: Parsed episode information or None if not found
         """
         # First try standard episode patterns
-        for pat in self.EP_PATTERNS:
-            if m := re.search(pat, name, re.IGNORECASE):
-                try:
-                    return EpisodeInfo(season=int(m[1]), episode=int(m[2]))
-                except (ValueError, IndexError):
-                    pass
+        if ep := _search_episode(name):
+            return EpisodeInfo(season=ep[0], episode=ep[1])
         
         # Then try to extract season from the name for better series context
         season = self._extract_season_info(name)
         if season:
             # Look for episode number in patterns like "Episode 01" or "Ep 01"
-            ep_match = re.search(r'[Ee]p(?:isode)?\s*[#:]?\s*(\d{1,3})', name, re.IGNORECASE)
+            ep_match = _EP_WORD_RE.search(name)
             if ep_match:
                 try:
                     return EpisodeInfo(season=season, episode=int(ep_match.group(1)))
@@ -633,7 +1173,7 @@ class MediaRenamer:
 
         # Handle standalone episode patterns like E01, EP01, Folge 01, Episode 01
         for pat in self.EP_ONLY_PATTERNS:
-            ep_match = re.search(pat, name, re.IGNORECASE)
+            ep_match = pat.search(name)
             if ep_match:
                 try:
                     return EpisodeInfo(season=1, episode=int(ep_match.group(1)))
@@ -655,7 +1195,7 @@ class MediaRenamer:
             int | None: Season number if found, None otherwise
         """
         for pattern in self.SEASON_PATTERNS:
-            match = re.search(pattern, name, re.IGNORECASE)
+            match = pattern.search(name)
             if match:
                 try:
                     return int(match.group(1))
@@ -679,17 +1219,12 @@ class MediaRenamer:
         if directory.parent:
             parent_name = directory.parent.name
             # If parent directory contains season info, it's likely a series name
-            if re.search(r'\b(?:season|staffel)\b', parent_name, re.IGNORECASE):
+            if _SEASON_WORD_RE.search(parent_name):
                 # Extract series name by removing season info
-                series_name = re.sub(
-                    r'\s*\b(?:[Ss]eason|[Ss]taffel)\b(?:\s*\d+)?\b.*',
-                    '',
-                    parent_name,
-                    flags=re.IGNORECASE,
-                )
+                series_name = _SEASON_SUFFIX_RE.sub('', parent_name)
                 return series_name.strip()
             # If parent directory contains year pattern, it might be a series
-            elif re.search(r'\(\d{4}\)', parent_name):
+            elif _PAREN_YEAR_RE.search(parent_name):
                 return parent_name
         return None
 
@@ -714,8 +1249,8 @@ class MediaRenamer:
         if not value:
             return ""
         value = value.lower()
-        value = re.sub(r"[^a-z0-9äöüß]+", " ", value)
-        return re.sub(r"\s+", " ", value).strip()
+        value = _NON_ALNUM_RE.sub(" ", value)
+        return _WS_RE.sub(" ", value).strip()
 
     def _default_match_index(self, matches: list[MediaMatch], title: str | None, year: str | None) -> int:
         if not matches:
@@ -723,10 +1258,10 @@ class MediaRenamer:
 
         source = self._normalize_title(title)
         best_idx = 0
-        best_score = -1
+        best_score = -1.0
 
         for idx, match in enumerate(matches):
-            score = 0
+            score = 0.0
             if year and match.year == year:
                 score += 3
 
@@ -746,27 +1281,31 @@ class MediaRenamer:
         return best_idx
 
     def _is_collection(self, folder_name: str, videos: list[VideoFile]) -> bool:
-        if re.search(r'[Ss]\d{1,2}[Ee]\d{1,3}|\d{1,2}[xX]\d{1,3}|season|staffel', folder_name, re.IGNORECASE):
+        if _SERIES_HINT_RE.search(folder_name):
             return False
 
         if any(v.episode_info for v in videos):
             return False
 
-        for pat in self.COLLECTION_PATTERNS:
-            if re.search(pat, folder_name, re.IGNORECASE):
-                return True
-
-        if len(videos) >= 2:
-            years = set(v.extracted_year for v in videos if v.extracted_year)
-            if len(years) >= 2:
-                return True
+        if self._COLL_UNION.search(folder_name):
+            return True
 
-            titles = set(v.extracted_title for v in videos if v.extracted_title)
-            if len(titles) >= 2:
-                return True
+        if len(videos) < 2:
+            return False
 
-            big_movies = [v for v in videos if v.size_gb > 1 and not v.episode_info]
-            if len(big_movies) >= 2:
+        # One pass; stop as soon as two distinct years, two distinct titles
+        # or two big (> 1 GB) movies are seen. Episode files were ruled out above.
+        years: set[str] = set()
+        titles: set[str] = set()
+        big_movies = 0
+        for v in videos:
+            if v.extracted_year:
+                years.add(v.extracted_year)
+            if v.extracted_title:
+                titles.add(v.extracted_title)
+            if v.size_bytes > 1 << 30:
+                big_movies += 1
+            if len(years) >= 2 or len(titles) >= 2 or big_movies >= 2:
                 return True
 
         return False
@@ -811,7 +1350,7 @@ class MediaRenamer:
             dir_and_parent_names.append(directory.parent.name)
 
         for name in dir_and_parent_names:
-            if re.search(r's\d{1,2}|season|staffel', name, re.I):
+            if _SEASON_HINT_RE.search(name):
                 return MediaType.SERIES, videos
 
         # Enhanced series detection for separate episode folders
@@ -827,12 +1366,12 @@ class MediaRenamer:
         # Check if this looks like an episode folder (common pattern: E074, Ep074, Episode 74, numeric folders like 074)
         folder_name = directory.name
         # Match patterns like "Ep 07", "E07", "Episode 007" or numerical folders like "074" at the end
-        if re.search(r"(?:\b[Ee][Pp]?[\.\-\s]?\d{1,3}\b)|(?:\b(?:Episode|Folge)[\.\-\s]?\d{1,3}\b)|(?:\b\d{2,4}\b)$", folder_name):
+        if _EPISODE_FOLDER_RE.search(folder_name):
             # This looks like an episode folder - check parent for series name
             if directory.parent and directory.parent.name:
                 parent_name = directory.parent.name
                 # If parent doesn't contain season/episode or numeric patterns, it might be the series name
-                if not re.search(r'season|staffel|\d+x\d+', parent_name, re.I):
+                if not _PARENT_SERIES_RE.search(parent_name):
                     # Extract title from parent directory to help with series detection
                     title, year = self._extract_title_year(parent_name)
                     if title and len(title) >= 3:
@@ -843,41 +1382,173 @@ class MediaRenamer:
 
     # ==================== TMDB API ====================
 
-    def _tmdb_request(self, endpoint: str, params: dict | None = None) -> dict | None:
-        url = f"{self.TMDB_BASE}{endpoint}"
+    def _connect(self, url: urllib.parse.SplitResult) -> _Connection:
+        """Opens a connection to url's host, through a proxy if the environment
+        configures one (*_proxy / no_proxy, as urllib.request would).
+
+        Returns (connection, request-target prefix, extra request headers).
+        """
+        https = url.scheme == 'https'
+        conn_cls = http.client.HTTPSConnection if https else http.client.HTTPConnection
+        host = url.hostname or ''
+        proxy = None if urllib.request.proxy_bypass(host) else urllib.request.getproxies().get(url.scheme)
+        if not proxy:
+            return conn_cls(url.netloc, timeout=15), '', {}
+
+        purl = urllib.parse.urlsplit(proxy if '://' in proxy else f'http://{proxy}')
+        headers: dict[str, str] = {}
+        if purl.username:
+            cred = f"{urllib.parse.unquote(purl.username)}:{urllib.parse.unquote(purl.password or '')}"
+            headers['Proxy-Authorization'] = 'Basic ' + base64.b64encode(cred.encode()).decode('ascii')
+        proxy_host = purl.hostname or ''
+        proxy_port = purl.port or 80
+        if https:
+            # CONNECT tunnel through the proxy, TLS to the target inside it
+            conn = http.client.HTTPSConnection(proxy_host, proxy_port, timeout=15)
+            conn.set_tunnel(host, url.port, headers)
+            return conn, '', {}
+        # Plain HTTP proxies take the absolute URL as request target
+        return (http.client.HTTPConnection(proxy_host, proxy_port, timeout=15),
+                f'http://{url.netloc}', headers)
+
+    def _connection(self) -> _Connection:
+        """Returns this thread's keep-alive connection to the TMDb API."""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = self._local.conn = self._connect(self._api_url)
+        return conn
+
+    def _remember(self, key: _RequestKey, data: dict[str, Any] | None) -> None:
+        with self._cache_lock:
+            self._cache[key] = data
+            self._cache.move_to_end(key)
+            if len(self._cache) > API_MEMORY_CACHE_SIZE:
+                self._cache.popitem(last=False)
+
+    def _http_get(self, path: str) -> tuple[int, bytes, str | None]:
+        headers = {'Content-Type': 'application/json'}
+        url = self._api_url
+        for _hop in range(API_MAX_REDIRECTS + 1):
+            own = (url.scheme, url.netloc) == (self._api_url.scheme, self._api_url.netloc)
+            conn, prefix, extra = self._connection() if own else self._connect(url)
+            # Redirects to another host don't get the token
+            auth = {'Authorization': f'Bearer {self.access_token}'} if own else {}
+            try:
+                conn.request('GET', prefix + path, headers={**auth, **headers, **extra})
+                resp = conn.getresponse()
+                status, body = resp.status, resp.read()
+                location, retry_after = resp.getheader('Location'), resp.getheader('Retry-After')
+            except (OSError, http.client.HTTPException):
+                # Server dropped the idle connection or the network failed:
+                # reconnect on the next attempt
+                conn.close()
+                if own:
+                    self._local.conn = None
+                raise
+            finally:
+                if not own:
+                    conn.close()
+
+            if status not in (301, 302, 303, 307, 308) or not location:
+                return status, body, retry_after
+            url = urllib.parse.urlsplit(urllib.parse.urljoin(f"{url.scheme}://{url.netloc}{path}", location))
+            path = (url.path or '/') + (f"?{url.query}" if url.query else '')
+
+        return status, body, retry_after
+
+    def _tmdb_request(
+        self, endpoint: str, params: dict[str, Any] | None = None, persistent: bool = True
+    ) -> dict[str, Any] | None:
+        """Response data, or None if not found or the request failed."""
+        return self._tmdb_fetch(endpoint, params, persistent)[1]
+
+    def _tmdb_fetch(
+        self, endpoint: str, params: dict[str, Any] | None = None, persistent: bool = True
+    ) -> tuple[bool, dict[str, Any] | None]:
+        """Returns (ok, data). ok is False when the request failed (network,
+        rate limit, bad response), as opposed to an answer, including 404.
+        """
+        key = (endpoint, tuple(sorted(params.items())) if params else ())
+        with self._cache_lock:
+            if key in self._cache:
+                self._cache.move_to_end(key)
+                return True, self._cache[key]
+
+        cache_key = TMDbCache.make_key(endpoint, params) if persistent else None
+        if cache_key:
+            hit, body = self._api_cache.get(cache_key)
+            if hit:
+                data = _json_loads(body) if body is not None else None
+                self._remember(key, data)
+                return True, data
+
+        url = f"{self._api_url.path}{endpoint}"
         if params:
             url += "?" + urllib.parse.urlencode(params)
 
-        if url in self._cache:
-            return self._cache[url]
+        for attempt in range(API_RETRIES + 1):
+            delay = API_RETRY_BACKOFF * (2 ** attempt)
+            try:
+                status, body, retry_after = self._http_get(url)
+            except (OSError, http.client.HTTPException):
+                if attempt < API_RETRIES:
+                    time.sleep(delay)
+                    continue
+                return False, None
+
+            if status == 200:
+                try:
+                    data = _json_loads(body)
+                except ValueError:
+                    return False, None
+                self._remember(key, data)
+                if cache_key:
+                    self._api_cache.put(cache_key, body)
+                return True, data
+
+            if status == 404:
+                if cache_key:
+                    self._api_cache.put(cache_key, None)
+                return True, None
+
+            if status in (429, 502, 503, 504) and attempt < API_RETRIES:
+                if status == 429:
+                    delay = _retry_after_seconds(retry_after, 2)
+                time.sleep(delay)
+                continue
 
-        headers = {
-            'Authorization': f'Bearer {self.access_token}',
-            'Content-Type': 'application/json'
-        }
+            return False, None
 
-        try:
-            req = urllib.request.Request(url, headers=headers)
-            with urllib.request.urlopen(req, timeout=15) as r:
-                data = json.loads(r.read().decode())
-                self._cache[url] = data
-                return data
-        except urllib.error.HTTPError as e:
-            if e.code == 429:
-                time.sleep(2)
-                return self._tmdb_request(endpoint, params)
-            return None
-        except Exception:
-            return None
+        return False, None
 
     def _get_imdb_id(self, tmdb_id: int, media_type: str) -> str | None:
+        key = (tmdb_id, media_type)
+        try:
+            return self._imdb_id_memo[key]
+        except KeyError:
+            pass
+        imdb_id = self._get_imdb_id_uncached(tmdb_id, media_type)
+        # Failed requests aren't remembered (like in _tmdb_request), so only
+        # resolved ids are memoized; "no IMDb link" answers hit the LRU anyway
+        if imdb_id:
+            self._imdb_id_memo[key] = imdb_id
+        return imdb_id
+
+    def _get_imdb_id_uncached(self, tmdb_id: int, media_type: str) -> str | None:
+        imdb_id = self._api_cache.get_imdb_id(tmdb_id, media_type)
+        if imdb_id:
+            return imdb_id
+
         endpoint = f"/{media_type}/{tmdb_id}/external_ids"
         data = self._tmdb_request(endpoint)
 
         if not data:
             return None
 
-        return data.get('imdb_id')
+        imdb_id = data.get('imdb_id')
+        if imdb_id:
+            self._api_cache.put_imdb_id(tmdb_id, media_type, imdb_id)
+        return imdb_id
 
     def _generate_search_variants(self, title: str, year: str | None) -> list[tuple[str, str | None]]:
         variants = []
@@ -898,7 +1569,7 @@ class MediaRenamer:
             variants.append((title_ascii, None))
 
         if ' And ' in title or ' and ' in title:
-            title_amp = re.sub(r'\s+[Aa]nd\s+', ' & ', title)
+            title_amp = _AND_RE.sub(' & ', title)
             variants.append((title_amp, year))
             variants.append((title_amp, None))
 
@@ -925,8 +1596,23 @@ class MediaRenamer:
         return unique
 
     def _search_tmdb(self, title: str, year: str | None, mtype: MediaType) -> list[MediaMatch]:
+        key = (title, year, mtype)
+        cached = self._search_cache.get(key)
+        if cached is None:
+            cached, complete = self._search_tmdb_uncached(title, year, mtype)
+            # A failed request may succeed later in the run; don't pin "no match"
+            if complete:
+                self._search_cache[key] = cached
+        # Callers keep the list on their result objects; don't share it
+        return list(cached)
+
+    def _search_tmdb_uncached(
+        self, title: str, year: str | None, mtype: MediaType
+    ) -> tuple[list[MediaMatch], bool]:
+        """Returns (matches, complete); complete is False if any search request failed."""
         results: list[MediaMatch] = []
         seen_ids: set[int] = set()
+        complete = True
 
         endpoint = "/search/movie" if mtype != MediaType.SERIES else "/search/tv"
         media_str = "movie" if mtype != MediaType.SERIES else "tv"
@@ -941,7 +1627,9 @@ class MediaRenamer:
             if yr:
                 params['year' if mtype != MediaType.SERIES else 'first_air_date_year'] = yr
 
-            data = self._tmdb_request(endpoint, params)
+            ok, data = self._tmdb_fetch(endpoint, params)
+            if not ok:
+                complete = False
 
             if not data or 'results' not in data:
                 continue
@@ -982,7 +1670,7 @@ class MediaRenamer:
         else:
             results.sort(key=lambda r: -r.popularity)
 
-        return results[:10]
+        return results[:10], complete
 
     def _lookup_by_tmdb_id(self, tmdb_id: int) -> MediaMatch | None:
         """Look up a movie/TV show by TMDb ID."""
@@ -1106,7 +1794,7 @@ class MediaRenamer:
             if not manual.startswith('tt'):
                 manual = 'tt' + manual
 
-            if re.match(r'^tt\d{7,8}$', manual):
+            if _IMDB_ID_RE.match(manual):
                 endpoint = f"/find/{manual}"
                 params = {'external_source': 'imdb_id'}
                 data = self._tmdb_request(endpoint, params)
@@ -1159,7 +1847,7 @@ class MediaRenamer:
 
     def scan_folder(self, folder: Path) -> ScanResult:
         folder_name = folder.name
-        named_match = re.match(r'^(?P<title>.+)\s\((?P<year>\d{4})\)\s\[(?P<tag>imdbid-(?P<imdb>tt\d{7,}))\]$', folder_name)
+        named_match = _match_tagged(folder_name)
 
         detected_type, videos = self._detect_type(folder)
         title, year = self._extract_title_year(folder_name)
@@ -1170,7 +1858,7 @@ class MediaRenamer:
             if not t or len(t) < 3:
                 return False
             # Must have at least one word with 5+ letters AND at least 2 words total
-            words = re.findall(r'[a-zA-ZäöüÄÖÜß]{5,}', t, re.I)
+            words = _GOOD_WORD_RE.findall(t)
             if len(words) < 1:
                 return False
             # Also check for at least 2 words (real titles usually have multiple words)
@@ -1249,28 +1937,28 @@ class MediaRenamer:
             result.error = "No title"
             return result
 
-        print(f"  [DEBUG] Searching TMDb for: title='{title}', year='{year}', type={detected_type}")
+        result.log.append(f"  [DEBUG] Searching TMDb for: title='{title}', year='{year}', type={detected_type}")
         
         matches = self._search_tmdb(title, year, detected_type)
         result.matches = matches
 
-        print(f"  [DEBUG] Found {len(matches)} matches")
+        result.log.append(f"  [DEBUG] Found {len(matches)} matches for '{title}'")
         for i, m in enumerate(matches[:3]):
-            print(f"    [{i+1}] {m.title} ({m.year}) [tmdb={m.tmdb_id}, imdb={m.imdb_id}]")
+            result.log.append(f"    [{i+1}] {m.title} ({m.year}) [tmdb={m.tmdb_id}, imdb={m.imdb_id}]")
 
         # Check if we have a saved manual mapping for this folder
         if folder_name in self._manual_mappings:
             saved_imdb_id = self._manual_mappings[folder_name]
-            print(f"  [DEBUG] Found saved mapping: {saved_imdb_id}")
+            result.log.append(f"  [DEBUG] Found saved mapping: {saved_imdb_id}")
             # Try to look up the saved IMDB ID
             saved_match = self._manual_lookup(saved_imdb_id)
             if saved_match:
                 result.selected_match = saved_match
                 result.status = MatchStatus.MANUAL
-                print(f"  ✓ Using saved match: {saved_match.title} ({saved_match.year}) [{saved_match.imdb_id}]")
+                result.log.append(f"  ✓ Using saved match: {saved_match.title} ({saved_match.year}) [{saved_match.imdb_id}]")
                 return result
             else:
-                print(f"  ⚠ Saved mapping not found in TMDb, will try search results")
+                result.log.append(f"  ⚠ Saved mapping not found in TMDb, will try search results")
 
         if not matches:
             result.status = MatchStatus.NONE
@@ -1291,7 +1979,7 @@ class MediaRenamer:
             if not t or len(t) < 3:
                 return False
             # Must have at least one word with 5+ letters AND at least 2 words total
-            words = re.findall(r'[a-zA-ZäöüÄÖÜß]{5,}', t, re.I)
+            words = _GOOD_WORD_RE.findall(t)
             if len(words) < 1:
                 return False
             # Also check for at least 2 words (real titles usually have multiple words)
@@ -1307,7 +1995,7 @@ class MediaRenamer:
             if raw_title:
                 # Remove patterns like "1-5", "1", "2", "3" at the end that indicate collection numbers
                 # This converts "My Movie 1-5" to "My Movie"
-                collection_title = re.sub(r'\s+\d+(-\d+)?\s*$', '', raw_title).strip()
+                collection_title = _COLLECTION_NUM_RE.sub('', raw_title).strip()
                 # If removal left only one word, use the original
                 if len(collection_title.split()) < 2:
                     collection_title = raw_title
@@ -1328,7 +2016,7 @@ class MediaRenamer:
             if not is_good_title(title) and is_good_title(collection_title):
                 # Try to extract movie number from filename (e.g., "xyz1" -> 1, "xyz2" -> 2)
                 filename_stem = v.path.stem
-                num_match = re.search(r'(\d+)$', filename_stem)
+                num_match = _TRAILING_NUM_RE.search(filename_stem)
                 movie_number = num_match.group(1) if num_match else None
                 
                 if movie_number:
@@ -1379,11 +2067,11 @@ class MediaRenamer:
             
             # Remove season/episode patterns
             for pattern in self.EP_PATTERNS + self.SEASON_PATTERNS:
-                series_name = re.sub(pattern, '', series_name, flags=re.IGNORECASE)
+                series_name = pattern.sub('', series_name)
             
             # Clean up the name
-            series_name = re.sub(r'[^\w\s\-äöüÄÖÜ]', ' ', series_name)
-            series_name = re.sub(r'\s+', ' ', series_name).strip()
+            series_name = _GROUP_KEY_PUNCT_RE.sub(' ', series_name)
+            series_name = _WS_RE.sub(' ', series_name).strip()
             
             # Use first significant word(s) as key for grouping
             words = series_name.split()
@@ -1406,18 +2094,25 @@ class MediaRenamer:
         results: list[ScanResult] = []
 
         if show_progress:
-            print(f"\n  🔍 Scanning {len(folders)} folders...")
-
-        for i, folder in enumerate(folders):
-            if show_progress:
-                pct = (i + 1) / len(folders) * 100
-                print(f"  [{i+1}/{len(folders)}] {pct:.0f}% {folder.name[:40]}...", end="\r")
-
-            if self._is_audiobook(folder):
-                continue
-
-            result = self.scan_folder(folder)
-            results.append(result)
+            print(f"\n  🔍 Scanning {len(folders)} folders...", flush=True)
+
+        folders = [f for f in folders if not self._is_audiobook(f)]
+
+        # Folders are scanned concurrently so TMDb round trips overlap;
+        # map() keeps the results in input order.
+        with self._api_cache.batch(), ThreadPoolExecutor(max_workers=SCAN_WORKERS) as pool:
+            for i, result in enumerate(pool.map(self.scan_folder, folders)):
+                if result.log:
+                    # Workers only collect their messages; printing them here
+                    # keeps them from interleaving with the progress line
+                    if show_progress:
+                        print(" " * 80, end="\r")
+                    print("\n".join(result.log))
+                if show_progress:
+                    pct = (i + 1) / len(folders) * 100
+                    print(f"  [{i+1}/{len(folders)}] {pct:.0f}% {result.folder_name[:40]}...", end="\r", flush=True)
+
+                results.append(result)
 
         if show_progress:
             print(" " * 80, end="\r")
@@ -1449,6 +2144,12 @@ class MediaRenamer:
             print("  ❌ No items found")
             return []
 
+        status_counts = Counter(item.status for item in result.collection_items)
+        auto_count = status_counts[MatchStatus.AUTO]
+        unsure_count = status_counts[MatchStatus.UNSURE]
+        none_count = status_counts[MatchStatus.NONE]
+        all_auto = auto_count == len(result.collection_items)
+
         print(f"\n  {len(result.collection_items)} movies found:\n")
 
         for i, item in enumerate(result.collection_items, 1):
@@ -1477,13 +2178,15 @@ class MediaRenamer:
             print(f"              {match_str}")
             print()
 
-        auto_count = sum(1 for i in result.collection_items if i.status == MatchStatus.AUTO)
-        unsure_count = sum(1 for i in result.collection_items if i.status == MatchStatus.UNSURE)
-        none_count = sum(1 for i in result.collection_items if i.status == MatchStatus.NONE)
-
         print(f"{'─' * 80}")
         print(f"  Status: ✓ {auto_count} Automatic | ? {unsure_count} Uncertain | ✗ {none_count} No matches")
-        print(f"""
+
+        if all_auto:
+            # Nothing to decide: behave like <Enter> without prompting
+            print("  ✓ All movies matched automatically")
+            choice = ''
+        else:
+            print(f"""
       Commands:
         <Enter>  Accept all AUTO entries, review uncertain only
         a        Review every movie individually
@@ -1492,14 +2195,14 @@ class MediaRenamer:
         q        Back
         """)
 
-        while True:
+        while not all_auto:
             choice = input("  Choice (Enter=accept AUTO entries): ").strip().lower()
 
             if choice == 'q':
                 return []
 
             if choice == '0':
-                result.status = MatchStatus.SKIP
+                self._set_status(result, MatchStatus.SKIP)
                 return [result]
 
             if choice in ('', 's', 'a'):
@@ -1581,7 +2284,7 @@ class MediaRenamer:
                     manual = input("  ID (tt.../TMDb/Titel): ").strip()
                 else:
                     # Allow direct ID input
-                    manual = sel if sel else None
+                    manual = sel
 
                 if manual:
                     match = self._manual_lookup_direct(manual, result.folder_name if result else "")
@@ -1620,36 +2323,45 @@ class MediaRenamer:
         if new_results:
             print(f"\n  ✓ {len(new_results)} movies prepared")
 
-        result.status = MatchStatus.SKIP
+        self._set_status(result, MatchStatus.SKIP)
 
         return new_results
 
     # ==================== UI ====================
 
-    def show_scan_results(self, results: list[ScanResult]) -> None:
-        print(f"\n{'═' * 80}")
-        print(f"  📋 SCAN RESULTS")
-        print(f"{'═' * 80}")
+    def show_scan_results(self, results: list[ScanResult], force: bool = False) -> None:
+        # Skip redrawing an identical table unless explicitly asked for ('l').
+        # The key holds copies of every printed value, so in-place edits to a
+        # result or its selected match also trigger a redraw.
+        render_key = tuple(
+            (r.status, r.detected_type, r.folder_name, r.error, len(r.matches),
+             (r.selected_match.title, r.selected_match.year) if r.selected_match else None)
+            for r in results
+        )
+        if not force and render_key == self._last_render_key:
+            return
+        self._last_render_key = render_key
 
-        by_status = {}
-        for r in results:
-            by_status[r.status] = by_status.get(r.status, 0) + 1
+        # Rendered into one string and written at once
+        out: list[str] = []
+        out.append(f"\n{'═' * 80}")
+        out.append(f"  📋 SCAN RESULTS")
+        out.append(f"{'═' * 80}")
 
-        print(f"\n  Total: {len(results)} folders")
-        status_order = [MatchStatus.AUTO, MatchStatus.UNSURE, MatchStatus.MANUAL,
-                        MatchStatus.NONE, MatchStatus.SKIP, MatchStatus.DONE, MatchStatus.RENAMED]
-        for status in status_order:
+        by_status = Counter(r.status for r in results)
+
+        out.append(f"\n  Total: {len(results)} folders")
+        for status in self.STATUS_ORDER:
             if status in by_status:
-                print(f"    {status.value} {status.name}: {by_status[status]}")
+                out.append(f"    {status.value} {status.name}: {by_status[status]}")
 
-        print(f"\n{'─' * 80}")
-        print(f"  {'#':>3}  {'St':>2}  {'Type':>4}  {'Folder':<35}  {'→ Match':<25}")
-        print(f"{'─' * 80}")
+        out.append(f"\n{'─' * 80}")
+        out.append(f"  {'#':>3}  {'St':>2}  {'Type':>4}  {'Folder':<35}  {'→ Match':<25}")
+        out.append(f"{'─' * 80}")
 
         for i, r in enumerate(results, 1):
-            status = r.status.value
+            mark = r.status.value
             mtype = r.detected_type.name[:4] if r.detected_type else "?"
-            folder = r.folder_name[:35]
             
             if r.selected_match:
                 match = f"→ {r.selected_match.title} ({r.selected_match.year})"
@@ -1660,7 +2372,12 @@ class MediaRenamer:
             else:
                 match = ""
             
-            print(f"  {i:>3}  {status:>2}  {mtype:>4}  {folder:<35}  {match[:25]}")
+            # Precision in the format spec truncates without extra slices
+            out.append(f"  {i:>3}  {mark:>2}  {mtype:>4}  {r.folder_name:<35.35}  {match:.25}")
+
+        out.append('')
+        sys.stdout.write('\n'.join(out))
+        sys.stdout.flush()
 
     def _build_series_batch_preview(
         self,
@@ -1697,7 +2414,7 @@ class MediaRenamer:
                 'seasons': set(),
                 'members': [],
             })
-            entry['folders'] = int(entry['folders']) + 1  # type: ignore[union-attr]
+            entry['folders'] = int(entry['folders']) + 1
             members = entry['members']
             if isinstance(members, list):
                 members.append(result.folder_name)
@@ -1710,7 +2427,7 @@ class MediaRenamer:
         preview: list[dict[str, Any]] = []
         for name, info in batches.items():
             imdb = str(info.get('imdb', ''))
-            folders = int(info['folders'])  # type: ignore[arg-type]
+            folders = int(info['folders'])
             seasons_obj = info.get('seasons', set())
             seasons = seasons_obj if isinstance(seasons_obj, set) else set()
             members_obj = info.get('members', [])
@@ -1731,15 +2448,29 @@ class MediaRenamer:
         return preview
 
     def interactive_review(self, results: list[ScanResult], dry_run: bool = True) -> list[ScanResult]:
+        self._view = ResultsView(results)
+        try:
+            return self._interactive_review(self._view, dry_run)
+        finally:
+            self._view = None
+
+    def _interactive_review(self, view: ResultsView, dry_run: bool) -> list[ScanResult]:
+        results = view.results
+        merge_groups: list[dict[str, Any]] = []
+        # The batch preview is rebuilt only after something could have changed
+        dirty = True
 
         while True:
-            to_review = [i for i, r in enumerate(results)
-                         if r.status in (MatchStatus.UNSURE, MatchStatus.NONE, MatchStatus.MANUAL)
-                         and r.status != MatchStatus.RENAMED]
-            ready = [i for i, r in enumerate(results)
-                     if r.status in (MatchStatus.AUTO, MatchStatus.MANUAL) and r.selected_match]
-            done = [i for i, r in enumerate(results)
-                    if r.status in (MatchStatus.RENAMED, MatchStatus.DONE)]
+            # MANUAL entries with a match count as ready and to review
+            to_review = view.indices(MatchStatus.UNSURE, MatchStatus.NONE, MatchStatus.MANUAL)
+            ready = [i for i in view.indices(MatchStatus.AUTO, MatchStatus.MANUAL)
+                     if results[i].selected_match]
+            done = view.indices(MatchStatus.RENAMED, MatchStatus.DONE)
+            if dirty:
+                if self.series_batch_mode:
+                    preview = self._build_series_batch_preview(results, include_candidates=True)
+                    merge_groups = [p for p in preview if int(p['folders']) > 1]
+                dirty = False
 
             print(f"\n{'═' * 80}")
             print(f"  🔧 INTERACTIVE REVIEW")
@@ -1748,13 +2479,11 @@ class MediaRenamer:
             print(f"    ✓ Ready: {len(ready)}   ? To review: {len(to_review)}   ✔ Done: {len(done)}")
 
             if self.series_batch_mode:
-                preview = self._build_series_batch_preview(results, include_candidates=True)
-                merge_groups = [p for p in preview if int(p['folders']) > 1]  # type: ignore[arg-type]
                 if merge_groups:
                     print(f"\n  🔗 Series batch preview ({len(merge_groups)} merge group(s)):")
                     for group in merge_groups:
                         name = str(group.get('name', ''))
-                        folders = int(group['folders'])  # type: ignore[arg-type]
+                        folders = int(group['folders'])
                         seasons_obj = group.get('seasons', set())
                         seasons = seasons_obj if isinstance(seasons_obj, set) else set()
                         season_text = self._format_season_summary(seasons)
@@ -1782,16 +2511,18 @@ class MediaRenamer:
                 return results
 
             if choice == 'l':
-                self.show_scan_results(results)
+                self.show_scan_results(results, force=True)
                 continue
 
             if choice == 'x':
+                dirty = True
                 ok, skip, err = self.execute_renames(results, dry_run=dry_run)
                 print(f"\n  Result: ✅ {ok}  ⏭️ {skip}  ❌ {err}")
 
-                for r in results:
-                    if r.status in (MatchStatus.AUTO, MatchStatus.MANUAL) and r.selected_match and not dry_run:
-                        r.status = MatchStatus.RENAMED
+                if not dry_run:
+                    for i in view.indices(MatchStatus.AUTO, MatchStatus.MANUAL):
+                        if results[i].selected_match:
+                            self._set_status(results[i], MatchStatus.RENAMED)
 
                 if dry_run:
                     print(f"\n  💡 Use -x to perform the renaming for real")
@@ -1803,26 +2534,23 @@ class MediaRenamer:
             if choice == '' or choice == 'auto':
                 indices = to_review
             elif choice == 'a':
-                indices = [i for i in range(len(results)) if results[i].status != MatchStatus.RENAMED]
+                indices = view.excluding(MatchStatus.RENAMED)
             else:
-                indices = []
-                try:
-                    parts = choice.replace(',', ' ').split()
-                    for part in parts:
-                        if '-' in part:
-                            start, end = part.split('-')
-                            indices.extend(range(int(start) - 1, int(end)))
-                        else:
-                            indices.append(int(part) - 1)
-                    indices = [i for i in indices if 0 <= i < len(results)]
-                except ValueError:
+                if not _RANGE_LIST_RE.fullmatch(choice):
                     print("  ❌ Invalid")
                     continue
+                indices = [i for m in _RANGE_RE.finditer(choice)
+                           for i in range(int(m[1]) - 1, int(m[2] or m[1]))
+                           if 0 <= i < len(results)]
 
             if not indices:
                 print("  ℹ️  Nothing to work on")
                 continue
 
+            dirty = True
+            # Collection children are appended once the selection is done,
+            # not while it is being walked
+            new_results: list[ScanResult] = []
             for idx in indices:
                 result = results[idx]
 
@@ -1830,9 +2558,7 @@ class MediaRenamer:
                     continue
 
                 if result.detected_type == MediaType.COLLECTION:
-                    new_results = self.handle_collection(result)
-                    if new_results:
-                        results.extend(new_results)
+                    new_results.extend(self.handle_collection(result))
                     continue
 
                 print(f"\n{'─' * 80}")
@@ -1876,7 +2602,7 @@ class MediaRenamer:
                         sel = input(f"\n  Choice (Enter=suggested #{default_idx + 1}): ").strip().lower()
 
                         if sel == '0':
-                            result.status = MatchStatus.SKIP
+                            self._set_status(result, MatchStatus.SKIP)
                             break
 
                         if sel == 'm' or sel == 'x':
@@ -1884,7 +2610,7 @@ class MediaRenamer:
                             match = self._manual_lookup_direct(manual, result.folder_name if result else "")
                             if match:
                                 result.selected_match = match
-                                result.status = MatchStatus.MANUAL
+                                self._set_status(result, MatchStatus.MANUAL)
                                 # Save manual mapping for future runs
                                 if match.imdb_id:
                                     self._manual_mappings[result.folder_name] = match.imdb_id
@@ -1900,7 +2626,7 @@ class MediaRenamer:
                             num = int(sel) if sel else (default_idx + 1)
                             if 1 <= num <= len(result.matches):
                                 result.selected_match = result.matches[num - 1]
-                                result.status = MatchStatus.AUTO
+                                self._set_status(result, MatchStatus.AUTO)
                                 break
                         except ValueError:
                             pass
@@ -1914,13 +2640,13 @@ class MediaRenamer:
                         manual = input("  ID (tt.../TMDb/Titel): ").strip()
                     else:
                         # Allow direct ID input (e.g., user types tt0120188 directly)
-                        manual = sel if sel else None
+                        manual = sel
 
                     if manual:
                         match = self._manual_lookup_direct(manual, result.folder_name if result else "")
                         if match:
                             result.selected_match = match
-                            result.status = MatchStatus.MANUAL
+                            self._set_status(result, MatchStatus.MANUAL)
                             # Save manual mapping for future runs
                             if match.imdb_id:
                                 self._manual_mappings[result.folder_name] = match.imdb_id
@@ -1930,10 +2656,11 @@ class MediaRenamer:
                                 print(f"  ✓ Match: {match.title} ({match.year})")
                         else:
                             print("  ❌ Not found")
-                            result.status = MatchStatus.SKIP
+                            self._set_status(result, MatchStatus.SKIP)
                     else:
-                        result.status = MatchStatus.SKIP
+                        self._set_status(result, MatchStatus.SKIP)
 
+            view.extend(new_results)
             self.show_scan_results(results)
 
         return results
@@ -1943,10 +2670,8 @@ class MediaRenamer:
     def _sanitize(self, name: str) -> str:
         if not name:
             raise RenameError("Empty name")
-        for c in '<>:"/\\|?*':
-            name = name.replace(c, '')
-        name = re.sub(r'[\x00-\x1f]', '', name)
-        name = re.sub(r'\s+', ' ', name).strip('. ')
+        name = name.translate(_BAD_CHARS_TABLE)
+        name = _WS_RE.sub(' ', name).strip('. ')
         if not name:
             raise RenameError("Name empty after sanitization")
         if len(name) > 200:
@@ -1955,10 +2680,10 @@ class MediaRenamer:
 
     def _sub_lang(self, filename: str) -> str:
         low = filename.lower()
-        for code, norm in self.LANG_MAP.items():
-            if re.search(rf'[._]{code}[._]', low):
-                return f'.{norm}'
-        if re.search(r'[._]forced[._]', low):
+        for pat, suffix in self._LANG_RES:
+            if pat.search(low):
+                return suffix
+        if _FORCED_RE.search(low):
             return '.forced'
         return ''
 
@@ -1975,13 +2700,8 @@ class MediaRenamer:
                 return season, f"season-pattern:{candidate}"
 
         for candidate in candidates:
-            for pat in self.EP_PATTERNS:
-                match = re.search(pat, candidate, re.IGNORECASE)
-                if match:
-                    try:
-                        return int(match.group(1)), f"episode-pattern:{candidate}"
-                    except (ValueError, IndexError):
-                        pass
+            if ep := _search_episode(candidate):
+                return ep[0], f"episode-pattern:{candidate}"
 
         for candidate in candidates:
             episode_info = self._parse_episode(candidate)
@@ -2054,7 +2774,7 @@ class MediaRenamer:
             if p.is_file()
             and p.suffix.lower() in episode_ext
             and p.parent != root_dir
-            and not re.fullmatch(r'Season\s\d{2}', p.parent.name)
+            and not _SEASON_DIR_RE.fullmatch(p.parent.name)
         ]
         for item in remaining_files:
             season, reason = self._season_inference_details(item, fallback=fallback_season)
@@ -2063,7 +2783,7 @@ class MediaRenamer:
         for folder in sorted((d for d in root_dir.rglob('*') if d.is_dir()), key=lambda d: len(d.parts), reverse=True):
             if folder == root_dir:
                 continue
-            if re.fullmatch(r'Season\s\d{2}', folder.name):
+            if _SEASON_DIR_RE.fullmatch(folder.name):
                 continue
             try:
                 next(folder.iterdir())
@@ -2090,16 +2810,23 @@ class MediaRenamer:
     def _is_sample_video(self, path: Path) -> bool:
         if path.suffix.lower() not in self.VIDEO_EXT:
             return False
-        return bool(re.search(r'(^|[\._\-\s])sample([\._\-\s]|$)', path.stem, re.IGNORECASE))
+        return bool(_SAMPLE_RE.search(path.stem))
 
     def execute_renames(self, results: list[ScanResult], dry_run: bool = True) -> tuple[int, int, int]:
+        if dry_run:
+            # Nothing touches the disk, so the planned renames can be listed
+            # in large writes; real runs keep per-line output for rollbacks
+            with _buffered_stdout():
+                return self._execute_renames(results, dry_run)
+        return self._execute_renames(results, dry_run)
+
+    def _execute_renames(self, results: list[ScanResult], dry_run: bool) -> tuple[int, int, int]:
         ok, skip, err = 0, 0, 0
         series_stats: dict[str, dict[str, Any]] = {}
 
         to_rename = [r for r in results
                      if r.status in (MatchStatus.AUTO, MatchStatus.MANUAL)
-                     and r.selected_match
-                     and r.status != MatchStatus.RENAMED]
+                     and r.selected_match]
 
         if self.series_batch_mode and to_rename:
             series_groups: dict[str, list[ScanResult]] = {}
@@ -2108,7 +2835,7 @@ class MediaRenamer:
 
             for r in to_rename:
                 m = r.selected_match
-                is_series = bool(m) and (r.detected_type == MediaType.SERIES or m.media_type == 'tv')
+                is_series = m is not None and (r.detected_type == MediaType.SERIES or m.media_type == 'tv')
                 if not is_series or not m:
                     non_series.append(r)
                     continue
@@ -2140,18 +2867,30 @@ class MediaRenamer:
             if series_count:
                 print(f"  🔗 SERIES BATCH MODE active ({series_count} series folders grouped)")
 
+        # Resolve missing IMDb ids up front and concurrently, instead of one
+        # round trip per folder inside the rename loop
+        missing: dict[tuple[int, str], list[MediaMatch]] = {}
+        for r in to_rename:
+            m = r.selected_match
+            if m and not m.imdb_id:
+                missing.setdefault((m.tmdb_id, m.media_type), []).append(m)
+        if missing:
+            print(f"\n  🔍 Fetching missing IMDb IDs ({len(missing)})...")
+            keys = list(missing)
+            with self._api_cache.batch(), ThreadPoolExecutor(max_workers=SCAN_WORKERS) as pool:
+                for id_key, imdb_id in zip(keys, pool.map(lambda k: self._get_imdb_id(*k), keys)):
+                    for m in missing[id_key]:
+                        m.imdb_id = imdb_id
+
+        # First pass: validate and name every folder, so the rename loop
+        # below only sees entries that are ready to go
+        planned: list[tuple[ScanResult, MediaMatch, str]] = []
         for result in to_rename:
-            self._ops.clear()
-
             match = result.selected_match
             if not match:
                 skip += 1
                 continue
 
-            if not match.imdb_id:
-                print(f"\n  🔍 Fetching IMDb ID for: {match.title} (TMDb: {match.tmdb_id})")
-                match.imdb_id = self._get_imdb_id(match.tmdb_id, match.media_type)
-
             # Allow films without IMDB if TMDb has no IMDB link
             use_imdb_id = match.imdb_id
             if not use_imdb_id:
@@ -2159,7 +2898,7 @@ class MediaRenamer:
                 print(f"  ⚠️ No IMDB ID available for: {match.title} (TMDb: {match.tmdb_id})")
                 use_imdb_id = None
 
-            if use_imdb_id and use_imdb_id.startswith('tt') and not re.match(r'^tt\d{7,}$', use_imdb_id):
+            if use_imdb_id and use_imdb_id.startswith('tt') and not _valid_imdb(use_imdb_id):
                 print(f"\n  ❌ {result.folder_name}")
                 print(f"     Invalid IMDb ID: {use_imdb_id}")
                 err += 1
@@ -2185,10 +2924,16 @@ class MediaRenamer:
                 continue
 
             result.new_name = new_name
+            planned.append((result, match, new_name))
+
+        for result, match, new_name in planned:
+            self._ops.clear()
 
-            print(f"\n  {'📋' if dry_run else '⚡'} {result.folder_name}")
-            print(f"     → {new_name}")
-            print(f"     🆔 IMDb: {match.imdb_id} | TMDb: {match.tmdb_id}")
+            sys.stdout.write(
+                f"\n  {'📋' if dry_run else '⚡'} {result.folder_name}\n"
+                f"     → {new_name}\n"
+                f"     🆔 IMDb: {match.imdb_id} | TMDb: {match.tmdb_id}\n"
+            )
 
             is_series_result = result.detected_type == MediaType.SERIES or match.media_type == 'tv'
 
@@ -2198,7 +2943,7 @@ class MediaRenamer:
                     'seasons': set(),
                     'imdb_id': match.imdb_id or '',
                 })
-                stats['folders'] = int(stats['folders']) + 1  # type: ignore[union-attr]
+                stats['folders'] = int(stats['folders']) + 1
                 if result.season_number:
                     cast_seasons = stats['seasons']
                     if isinstance(cast_seasons, set):
@@ -2208,6 +2953,8 @@ class MediaRenamer:
                 ok += 1
                 continue
 
+            # Show each folder before touching the disk, also when piped
+            sys.stdout.flush()
             try:
                 if result.path.is_dir():
                     new_dir = result.path.parent / new_name
@@ -2217,7 +2964,15 @@ class MediaRenamer:
                         raise RenameError("Cross-Filesystem")
 
                     if result.path.name != new_name:
-                        if new_dir.exists():
+                        if new_dir.exists() and os.path.samefile(result.path, new_dir):
+                            # Case-only change on a case-insensitive filesystem: the
+                            # target "exists" as the folder itself, so go through a
+                            # temp name to make the new spelling stick
+                            temp = result.path.parent / f".tmp_{time.time_ns()}_{match.tmdb_id}"
+                            self._do_rename(result.path, temp)
+                            self._do_rename(temp, new_dir)
+                            working = new_dir
+                        elif new_dir.exists():
                             if not is_series:
                                 raise RenameError("Target already exists")
 
@@ -2233,9 +2988,7 @@ class MediaRenamer:
                         else:
                             if is_series:
                                 print(f"     🆕 SERIES ROOT: create '{new_dir.name}' from '{result.path.name}'")
-                            temp = result.path.parent / f".tmp_{int(time.time() * 1000)}_{match.tmdb_id}"
-                            self._do_rename(result.path, temp)
-                            self._do_rename(temp, new_dir)
+                            self._do_rename(result.path, new_dir)
                             working = new_dir
                     else:
                         working = result.path
@@ -2248,16 +3001,32 @@ class MediaRenamer:
                                 cast_seasons.update(seasons)
                         print(f"     ✅ Series folder renamed + {moved} files in {len(seasons)} season folder(s)")
                         self._commit()
-                        result.status = MatchStatus.RENAMED
+                        self._set_status(result, MatchStatus.RENAMED)
                         ok += 1
                         continue
 
                     renamed = 0
                     skipped = 0
                     
-                    # Get all video files and sort by size (largest first)
-                    video_files = [f for f in working.iterdir() if f.is_file() and f.suffix.lower() in self.VIDEO_EXT]
-                    video_files.sort(key=lambda x: x.stat().st_size, reverse=True)
+                    # List the folder once; DirEntry answers is_file() from the
+                    # directory read, so only video files need a stat (for size)
+                    videos_by_size: list[tuple[int, str]] = []
+                    other_files: list[tuple[str, str]] = []
+                    with os.scandir(working) as it:
+                        for entry in it:
+                            if not entry.is_file():
+                                continue
+                            fn = entry.name
+                            dot = fn.rfind('.')
+                            ext = fn[dot:].lower() if 0 < dot < len(fn) - 1 else ''  # same as Path.suffix
+                            if ext in self.VIDEO_EXT:
+                                videos_by_size.append((entry.stat().st_size, fn))
+                            else:
+                                other_files.append((fn, ext))
+
+                    # Video files sorted by size (largest first)
+                    videos_by_size.sort(key=lambda sv: sv[0], reverse=True)
+                    video_files = [working / fn for _, fn in videos_by_size]
                     
                     # Handle empty video files case
                     if not video_files:
@@ -2267,26 +3036,19 @@ class MediaRenamer:
                     # Identify the main movie (largest video file)
                     main_movie = video_files[0]
                     
-                    # First pass: handle non-video files and main movie
-                    for item in working.iterdir():
-                        if not item.is_file():
-                            continue
-                        ext = item.suffix.lower()
-                        
-                        # Skip video files in first pass (handled separately)
-                        if ext in self.VIDEO_EXT:
-                            continue
-                        
+                    # First pass: handle non-video files (videos are handled separately)
+                    working_str = os.fspath(working) + os.sep
+                    for fn, ext in other_files:
                         new_fn = None
                         if ext in self.RENAME_EXT:
                             new_fn = f"{new_name}{ext}"
                         elif ext in self.SUB_EXT:
-                            new_fn = f"{new_name}{self._sub_lang(item.name)}{ext}"
+                            new_fn = f"{new_name}{self._sub_lang(fn)}{ext}"
                         
-                        if new_fn and item.name != new_fn:
-                            target = working / new_fn
-                            if not target.exists():
-                                self._do_rename(item, target)
+                        if new_fn and fn != new_fn:
+                            target_str = working_str + new_fn
+                            if not os.path.exists(target_str):
+                                self._do_rename(working_str + fn, target_str)
                                 renamed += 1
                             else:
                                 skipped += 1
@@ -2340,7 +3102,7 @@ class MediaRenamer:
                                 # Swap: rename smaller to temp, main to target, smaller to main's old name
                                 # Use smaller file's extension for temp name
                                 temp_ext = smaller_file.suffix
-                                temp_name = working / f".tmp_swap_{int(time.time() * 1000)}{temp_ext}"
+                                temp_name = working / f".tmp_swap_{time.time_ns()}{temp_ext}"
                                 
                                 # Atomic swap with rollback on failure
                                 swap_success = False
@@ -2370,8 +3132,6 @@ class MediaRenamer:
                                     print(f"     🔄 Swapped: {main_file.name} ({main_size/MB:.1f}MB) -> {target.name}")
                                     print(f"        {smaller_file.name} ({smaller_size/MB:.1f}MB) -> {main_file.name}")
                                     renamed += 2  # Two files were swapped
-                                    self._commit()
-                                    result.status = MatchStatus.RENAMED
                             else:
                                 skipped += 1
 
@@ -2390,7 +3150,7 @@ class MediaRenamer:
                     print(f"     ✅ Folder created + file moved")
 
                 self._commit()
-                result.status = MatchStatus.RENAMED
+                self._set_status(result, MatchStatus.RENAMED)
                 ok += 1
 
             except RenameError as e:
@@ -2416,7 +3176,7 @@ class MediaRenamer:
             )
 
             for series_name, stats in sorted_items:
-                folders = int(stats['folders'])  # type: ignore[arg-type]
+                folders = int(stats['folders'])
                 seasons_obj = stats.get('seasons', set())
                 seasons = seasons_obj if isinstance(seasons_obj, set) else set()
                 season_text = self._format_season_summary(seasons)
@@ -2426,7 +3186,7 @@ class MediaRenamer:
         return ok, skip, err
 
 
-def print_token_help():
+def print_token_help() -> None:
         """Displays help for token configuration."""
         print("""
     ❌ TMDb access token not found!
@@ -2453,7 +3213,7 @@ def print_token_help():
 """)
 
 
-def main():
+def main() -> None:
     import argparse
 
     p = argparse.ArgumentParser(
@@ -2479,6 +3239,12 @@ Environment variables:
 
     args = p.parse_args()
 
+    try:
+        # Line editing and history for the interactive prompts
+        import readline  # noqa: F401
+    except ImportError:
+        pass
+
     # Determine token: CLI > environment > file
     token = args.token or get_tmdb_token()
 
@@ -2528,7 +3294,7 @@ Environment variables:
     )
 
     # Test API connection
-    print(f"\n  🔑 Checking API connection...", end=" ")
+    print(f"\n  🔑 Checking API connection...", end=" ", flush=True)
     if not renamer.verify_api_connection():
         print("❌")
         print("""